@@ -0,0 +1,166 @@
+"""
+Batch Analysis Script for Multiple Marketing Campaigns
+Runs the preprocessing, KPI and visualization pipeline for many campaign files
+across a process pool and builds a combined cross-campaign KPI table
+"""
+
+import argparse
+import contextlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+import pandas as pd
+from data_preprocessing import DataPreprocessor
+from kpi_calculator import KPICalculator
+from visualization import CampaignVisualizer
+
+def collect_inputs(source):
+    """
+    Collect campaign files from a directory (all *.csv files) or a manifest
+    Manifest files list one CSV path per line, relative to the manifest; '#' starts a comment
+    """
+    source = Path(source)
+    if source.is_dir():
+        paths = sorted(source.glob('*.csv'))
+    else:
+        paths = []
+        for line in source.read_text().splitlines():
+            line = line.split('#', 1)[0].strip()
+            if line:
+                path = Path(line)
+                paths.append(path if path.is_absolute() else source.parent / path)
+
+    campaigns = {}
+    for path in paths:
+        if path.stem in campaigns:
+            raise ValueError(f"Duplicate campaign name '{path.stem}': {campaigns[path.stem]} and {path}")
+        campaigns[path.stem] = path
+    return campaigns
+
+def run_campaign(campaign, data_path, output_dir, make_figures=True):
+    """Run the full analysis for one campaign file and return its KPI summary"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    summary = {'campaign': campaign, 'data_path': str(data_path)}
+
+    with open(output_dir / 'analysis.log', 'w') as log, contextlib.redirect_stdout(log):
+        try:
+            preprocessor = DataPreprocessor(data_path)
+            preprocessor.load_data()
+            df = preprocessor.clean_data()
+            preprocessor.save_processed_data(output_dir / 'processed_data.csv')
+
+            calculator = KPICalculator(df)
+            kpis = calculator.generate_kpi_report()
+            pd.Series(kpis).to_csv(output_dir / 'kpis.csv', header=['value'])
+
+            if make_figures:
+                visualizer = CampaignVisualizer(df, output_dir=output_dir / 'figures')
+                visualizer.generate_all_visualizations()
+
+            summary['total_contacts'] = len(df)
+            summary['conversions'] = int(df['converted'].sum())
+            summary['conversion_rate'] = calculator.calculate_conversion_rate()
+            summary.update(kpis)
+            summary['status'] = 'ok'
+        except Exception as e:
+            print(f"Analysis failed: {e!r}")
+            summary['status'] = 'failed'
+            summary['error'] = repr(e)
+
+    summary['elapsed_seconds'] = round(time.perf_counter() - start, 2)
+    return summary
+
+def save_combined_table(summaries, output_root):
+    """Build the cross-campaign KPI table from campaign summaries and save it"""
+    combined = pd.DataFrame(summaries)
+    if len(combined):
+        trailing = [c for c in ['data_path', 'status', 'error', 'elapsed_seconds'] if c in combined.columns]
+        combined = combined[[c for c in combined.columns if c not in trailing] + trailing]
+        combined = combined.set_index('campaign').sort_index()
+    combined.to_csv(output_root / 'campaign_kpis.csv')
+    return combined
+
+def run_pool(campaigns, output_root, max_workers, make_figures, on_summary):
+    """
+    Run campaigns in one process pool, passing each summary to on_summary
+    Returns the campaigns left unfinished because a worker died and broke the pool
+    """
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_campaign, campaign, path, output_root / campaign, make_figures): campaign
+                   for campaign, path in campaigns.items()}
+        for future in as_completed(futures):
+            campaign = futures[future]
+            try:
+                summary = future.result()
+            except BrokenProcessPool:
+                unfinished.append(campaign)
+                continue
+            except Exception as e:
+                summary = {'campaign': campaign, 'data_path': str(campaigns[campaign]),
+                           'status': 'failed', 'error': repr(e), 'elapsed_seconds': 0.0}
+            on_summary(summary)
+    return unfinished
+
+def run_batch(source, output_root='outputs/campaigns', max_workers=None, make_figures=True):
+    """Run all campaigns across a process pool and save the combined KPI table"""
+    campaigns = collect_inputs(source)
+    output_root = Path(output_root)
+    output_root.mkdir(parents=True, exist_ok=True)
+    max_workers = max_workers or os.cpu_count()
+
+    print(f"Running {len(campaigns)} campaigns with {max_workers} workers...")
+    start = time.perf_counter()
+    summaries = []
+
+    def record(summary):
+        summaries.append(summary)
+        print(f"[{len(summaries)}/{len(campaigns)}] {summary['campaign']}: "
+              f"{summary['status']} ({summary['elapsed_seconds']:.1f}s)")
+
+    # The table is written even if the batch is interrupted, covering the campaigns finished so far
+    try:
+        pending = campaigns
+        while pending:
+            # run_campaign creates analysis.log first, so it marks the campaigns a dead pool had started
+            for campaign in pending:
+                (output_root / campaign / 'analysis.log').unlink(missing_ok=True)
+            unfinished = run_pool(pending, output_root, max_workers, make_figures, record)
+
+            # Retry the started ones alone: only a campaign that kills its own worker is marked failed
+            started = [c for c in unfinished if (output_root / c / 'analysis.log').exists()] or unfinished
+            for campaign in started:
+                if run_pool({campaign: campaigns[campaign]}, output_root, 1, make_figures, record):
+                    record({'campaign': campaign, 'data_path': str(campaigns[campaign]),
+                            'status': 'failed', 'error': 'Worker process died (BrokenProcessPool)',
+                            'elapsed_seconds': 0.0})
+            pending = {c: campaigns[c] for c in unfinished if c not in started}
+    finally:
+        combined = save_combined_table(summaries, output_root)
+
+    failed = (combined['status'] != 'ok').sum() if len(combined) else 0
+    print(f"\nBatch complete in {time.perf_counter() - start:.1f}s "
+          f"({len(combined) - failed} succeeded, {failed} failed)")
+    print(f"Combined KPI table saved to {output_root / 'campaign_kpis.csv'}")
+    return combined
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the campaign analysis for many campaign files")
+    parser.add_argument('source', help="Directory of campaign CSV files or a manifest listing them")
+    parser.add_argument('--output', default='outputs/campaigns', help="Root folder for per-campaign outputs")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--no-figures', action='store_true', help="Skip generating visualizations")
+    args = parser.parse_args()
+
+    run_batch(args.source, args.output, args.workers, make_figures=not args.no_figures)
+
+if __name__ == "__main__":
+    main()
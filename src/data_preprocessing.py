@@ -2,10 +2,17 @@
 Data Preprocessing Module for Marketing Campaign Analysis
 """
 
+import json
+import os
+import shutil
+import time
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+MONTH_ORDER = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+               'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+
 class DataPreprocessor:
     def __init__(self, data_path):
         self.data_path = data_path
@@ -36,7 +43,7 @@ class DataPreprocessor:
         # Handle missing values
         if 'unknown' in self.df.values:
             for col in self.df.columns:
-                if self.df[col].dtype == 'object':
+                if self.df[col].dtype == 'object' or pd.api.types.is_string_dtype(self.df[col]):
                     self.df[col] = self.df[col].replace('unknown', np.nan)
         
         # Convert target variable to binary
@@ -51,9 +58,7 @@ class DataPreprocessor:
         
         # Extract month and day features
         if 'month' in self.df.columns:
-            month_order = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 
-                          'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-            self.df['month_num'] = self.df['month'].map({m: i+1 for i, m in enumerate(month_order)})
+            self.df['month_num'] = self.df['month'].map({m: i+1 for i, m in enumerate(MONTH_ORDER)})
         
         print("Data cleaning completed!")
         return self.df
@@ -62,14 +67,111 @@ class DataPreprocessor:
         """Save processed data"""
         self.df.to_csv(output_path, index=False)
         print(f"Processed data saved to {output_path}")
+    
+    def save_column_store(self, store_dir, keep_versions=2):
+        """
+        Save processed data as a memory-mapped column store
+        Each column is written as a fixed-width .npy array (text and categorical
+        columns as integer codes, -1 for missing) plus a metadata.json dictionary.
+        Every save goes into a new version folder and the CURRENT pointer file is
+        swapped atomically, so files other processes have mapped are never rewritten.
+        """
+        store_dir = Path(store_dir)
+        version = f"v{time.time_ns()}_{os.getpid()}"
+        version_dir = store_dir / version
+        version_dir.mkdir(parents=True)
+        columns = []
+        
+        for i, col in enumerate(self.df.columns):
+            series = self.df[col]
+            meta = {'name': col, 'file': f"col_{i}.npy"}
+            
+            if pd.api.types.is_datetime64_any_dtype(series):
+                values = series.to_numpy(dtype='datetime64[ns]').view('int64')
+                meta.update(kind='datetime')
+            elif pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+                values = series.to_numpy()
+                meta.update(kind='numeric')
+            else:
+                if not isinstance(series.dtype, pd.CategoricalDtype):
+                    series = series.astype('category')
+                    meta['text'] = True
+                categories = series.cat.categories
+                if pd.api.types.is_numeric_dtype(categories):
+                    meta['categories_dtype'] = str(categories.dtype)
+                elif not pd.api.types.is_string_dtype(categories):
+                    raise TypeError(f"Column '{col}' has unsupported category type {categories.dtype}")
+                values = series.cat.codes.to_numpy()
+                meta.update(kind='categorical', categories=categories.tolist(),
+                            ordered=bool(series.cat.ordered))
+            
+            np.save(version_dir / meta['file'], np.ascontiguousarray(values))
+            columns.append(meta)
+        
+        metadata = {'n_rows': len(self.df), 'columns': columns}
+        with open(version_dir / 'metadata.json', 'w') as f:
+            json.dump(metadata, f, indent=2)
+        
+        pointer_tmp = store_dir / f"CURRENT.{version}.tmp"
+        pointer_tmp.write_text(version)
+        os.replace(pointer_tmp, store_dir / 'CURRENT')
+        
+        # Old versions may still be mapped by readers: unlinking is safe on POSIX,
+        # and folders locked on Windows are left for a later save to remove
+        versions = sorted((p for p in store_dir.glob('v*') if p.is_dir()),
+                          key=lambda p: int(p.name[1:].split('_')[0]))
+        for old in versions[:-keep_versions]:
+            shutil.rmtree(old, ignore_errors=True)
+        print(f"Column store saved to {version_dir}")
+
+def load_column_store(store_dir, columns=None, decode_text=False, retries=3):
+    """
+    Open a column store written by DataPreprocessor.save_column_store
+    Numeric and categorical columns wrap the memory-mapped arrays without copying,
+    so concurrent processes share the same page cache. Text columns come back as
+    categoricals unless decode_text=True.
+    """
+    store_dir = Path(store_dir)
+    for attempt in range(retries):
+        version_dir = store_dir / (store_dir / 'CURRENT').read_text().strip()
+        try:
+            return _open_store_version(version_dir, columns, decode_text)
+        except FileNotFoundError:
+            # The version was removed by a newer save between reading CURRENT and opening it
+            if attempt == retries - 1:
+                raise
+
+def _open_store_version(version_dir, columns, decode_text):
+    with open(version_dir / 'metadata.json') as f:
+        metadata = json.load(f)
+    
+    data = {}
+    for meta in metadata['columns']:
+        if columns is not None and meta['name'] not in columns:
+            continue
+        values = np.load(version_dir / meta['file'], mmap_mode='r')
+        
+        if meta['kind'] == 'categorical':
+            categories = pd.Index(meta['categories'], dtype=meta.get('categories_dtype'))
+            dtype = pd.CategoricalDtype(categories, ordered=meta['ordered'])
+            values = pd.Categorical.from_codes(values, dtype=dtype)
+            if decode_text and meta.get('text'):
+                values = np.asarray(values, dtype=object)
+        elif meta['kind'] == 'datetime':
+            values = values.view('datetime64[ns]')
+        data[meta['name']] = values
+    
+    return pd.DataFrame(data, copy=False)
 
 if __name__ == "__main__":
     # Example usage
     data_path = Path("data/bank-marketing.csv")
     output_path = Path("data/processed_data.csv")
+    store_path = Path("data/processed_store")
     
     preprocessor = DataPreprocessor(data_path)
     preprocessor.load_data()
     preprocessor.explore_data()
     preprocessor.clean_data()
     preprocessor.save_processed_data(output_path)
+    preprocessor.save_column_store(store_path)
@@ -5,6 +5,9 @@ Calculates ROI, CAC, CLV, Conversion Rate, and other metrics
 
 import pandas as pd
 import numpy as np
+from pathlib import Path
+from data_preprocessing import load_column_store
+from significance import SignificanceTester
 
 class KPICalculator:
     def __init__(self, df):
@@ -119,6 +122,7 @@ class KPICalculator:
         if channel_perf is not None:
             print(f"\n📱 Performance by Channel:")
             print(channel_perf.to_string())
+            SignificanceTester(channel_perf).generate_significance_report('Channel')
         
         # Campaign effectiveness
         campaign_eff = self.calculate_campaign_effectiveness()
@@ -132,7 +136,11 @@ class KPICalculator:
 
 if __name__ == "__main__":
     # Example usage
-    df = pd.read_csv("data/processed_data.csv")
+    store_path = Path("data/processed_store")
+    if store_path.exists():
+        df = load_column_store(store_path)
+    else:
+        df = pd.read_csv("data/processed_data.csv")
     
     calculator = KPICalculator(df)
     kpis = calculator.generate_kpi_report()
@@ -8,6 +8,7 @@ from pathlib import Path
 from data_preprocessing import DataPreprocessor
 from kpi_calculator import KPICalculator
 from visualization import CampaignVisualizer
+from time_series import TimeSeriesAnalyzer
 
 def main():
     print("="*60)
@@ -17,6 +18,7 @@ def main():
     # Define paths
     data_path = Path("data/bank-marketing.csv")
     processed_path = Path("data/processed_data.csv")
+    store_path = Path("data/processed_store")
     
     # Check if data exists
     if not data_path.exists():
@@ -36,6 +38,7 @@ def main():
     preprocessor.explore_data()
     df = preprocessor.clean_data()
     preprocessor.save_processed_data(processed_path)
+    preprocessor.save_column_store(store_path)
     
     # Step 2: KPI Calculation
     print("\n" + "="*60)
@@ -53,7 +56,20 @@ def main():
     visualizer = CampaignVisualizer(df)
     visualizer.generate_all_visualizations()
     
-    # Step 4: Key Insights
+    # Step 4: Trend Analysis
+    print("\n" + "="*60)
+    print("STEP 4: TREND ANALYSIS")
+    print("="*60)
+    
+    trend_alerts = None
+    if 'month' in df.columns and 'day' in df.columns:
+        trends = TimeSeriesAnalyzer(df)
+        trends.build_date_index()
+        trend_alerts = trends.generate_trend_report()
+    else:
+        print("Month/day columns not found - skipping trend analysis")
+    
+    # Step 5: Key Insights
     print("\n" + "="*60)
     print("KEY INSIGHTS & RECOMMENDATIONS")
     print("="*60)
@@ -101,12 +117,22 @@ def main():
         print(f"   • Best performing month: {best_month.upper()} ({best_month_rate:.2f}% conversion)")
         print(f"   • Recommendation: Increase campaign intensity during high-performing months")
     
+    # Weekly trend alerts
+    if trend_alerts is not None:
+        print(f"\n5. WEEKLY TRENDS:")
+        print(f"   • {len(trend_alerts)} week(s) with a statistically significant conversion rate swing")
+        if len(trend_alerts):
+            latest = trend_alerts.iloc[-1]
+            print(f"   • Most recent: {trend_alerts.index[-1]} ({latest['rate_change']:+.2f} points, "
+                  f"z={latest['z_score']:+.2f})")
+        print(f"   • Recommendation: Review targeting for weeks with sharp drops")
+    
     # ROI Analysis
     clv = kpis.get('CLV', 0)
     cac = kpis.get('CAC', 1)
     clv_cac_ratio = clv / cac if cac > 0 else 0
     
-    print(f"\n5. FINANCIAL METRICS:")
+    print(f"\n6. FINANCIAL METRICS:")
     print(f"   • CLV to CAC Ratio: {clv_cac_ratio:.2f}x")
     if clv_cac_ratio > 3:
         print(f"   • Status: ✅ EXCELLENT - Strong return on marketing investment")
@@ -123,6 +149,7 @@ def main():
     print("="*60)
     print(f"\n📊 Visualizations saved in: outputs/figures/")
     print(f"📄 Processed data saved in: data/processed_data.csv")
+    print(f"🗄️  Column store saved in: data/processed_store/")
     print("\nNext Steps:")
     print("1. Review visualizations in the outputs/figures folder")
     print("2. Share dashboard_summary.png with stakeholders")
@@ -0,0 +1,152 @@
+"""
+Significance Testing Module for Marketing Campaign Analysis
+Tests whether conversion rate differences between channels and segments are real
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+
+def adjust_pvalues(p_values, method='holm'):
+    """
+    Adjust p-values for multiple comparisons
+    method is one of 'bonferroni', 'holm' or 'fdr_bh' (Benjamini-Hochberg)
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    m = len(p_values)
+    if m == 0:
+        return p_values
+
+    if method == 'bonferroni':
+        return np.minimum(p_values * m, 1.0)
+
+    order = np.argsort(p_values)
+    ranked = p_values[order]
+    if method == 'holm':
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    elif method == 'fdr_bh':
+        adjusted = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+    else:
+        raise ValueError(f"Unknown correction method: {method}")
+
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+def sequential_test(conversions, contacts, tau=0.02, alpha=0.05):
+    """
+    Always-valid sequential test for a running campaign (mixture SPRT)
+    conversions and contacts are 2 x periods tables (segment A and B rows, one
+    column per look, e.g. from TimeSeriesAnalyzer.calculate_cohort_table).
+    The p-value can be checked after every period without inflating the
+    false positive rate; tau is the expected effect size as a proportion.
+    """
+    index = getattr(conversions, 'columns', None)
+    conversions = np.cumsum(np.asarray(conversions, dtype=float), axis=1)
+    contacts = np.cumsum(np.asarray(contacts, dtype=float), axis=1)
+
+    rate = np.divide(conversions, contacts, out=np.zeros_like(conversions), where=contacts > 0)
+    diff = rate[1] - rate[0]
+    variance = np.divide(rate * (1 - rate), contacts, out=np.full_like(rate, np.inf),
+                         where=contacts > 0).sum(axis=0)
+
+    # Likelihood ratio of a N(0, tau^2) mixture over the effect vs no effect.
+    # Looks with no information yet (an empty arm, or no variance such as zero
+    # conversions in both arms) carry no evidence: log_lr = 0, i.e. p = 1
+    tau2 = tau ** 2
+    informative = np.isfinite(variance) & (variance > 0)
+    v = np.where(informative, variance, 1.0)
+    log_lr = np.where(informative,
+                      0.5 * np.log(v / (v + tau2)) + diff ** 2 * tau2 / (2 * v * (v + tau2)),
+                      0.0)
+    p_value = np.minimum.accumulate(np.minimum(np.exp(-log_lr), 1.0))
+
+    return pd.DataFrame({
+        'rate_a': (rate[0] * 100).round(2),
+        'rate_b': (rate[1] * 100).round(2),
+        'difference': (diff * 100).round(2),
+        'p_value': p_value,
+        'significant': p_value < alpha
+    }, index=index)
+
+class SignificanceTester:
+    def __init__(self, segment_stats, alpha=0.05):
+        """
+        segment_stats is a segment sum/count table, either from
+        KPICalculator.calculate_conversion_rate (sum, count) or
+        calculate_channel_performance (conversions, total_contacts)
+        """
+        if 'conversions' in segment_stats.columns:
+            segment_stats = segment_stats.rename(columns={'conversions': 'sum', 'total_contacts': 'count'})
+        segment_stats = segment_stats[segment_stats['count'] > 0]
+
+        self.segments = segment_stats.index
+        self.conversions = segment_stats['sum'].to_numpy(dtype=float)
+        self.contacts = segment_stats['count'].to_numpy(dtype=float)
+        self.rates = self.conversions / self.contacts
+        self.alpha = alpha
+
+    def pairwise_z_tests(self, correction='holm'):
+        """Run two-proportion z-tests for every pair of segments in one pass"""
+        i, j = np.triu_indices(len(self.segments), k=1)
+
+        pooled = (self.conversions[i] + self.conversions[j]) / (self.contacts[i] + self.contacts[j])
+        std_err = np.sqrt(pooled * (1 - pooled) * (1 / self.contacts[i] + 1 / self.contacts[j]))
+        diff = self.rates[j] - self.rates[i]
+        z = np.divide(diff, std_err, out=np.zeros_like(diff), where=std_err > 0)
+        p_values = 2 * stats.norm.sf(np.abs(z))
+        p_adjusted = adjust_pvalues(p_values, correction)
+
+        return pd.DataFrame({
+            'segment_a': self.segments[i],
+            'segment_b': self.segments[j],
+            'rate_a': (self.rates[i] * 100).round(2),
+            'rate_b': (self.rates[j] * 100).round(2),
+            'difference': (diff * 100).round(2),
+            'z_score': z.round(4),
+            'p_value': p_values,
+            'p_adjusted': p_adjusted,
+            'significant': p_adjusted < self.alpha
+        })
+
+    def chi_square_test(self):
+        """Chi-square test of independence between segment and conversion"""
+        observed = np.vstack([self.conversions, self.contacts - self.conversions])
+        pooled = self.conversions.sum() / self.contacts.sum()
+        expected = np.vstack([self.contacts * pooled, self.contacts * (1 - pooled)])
+
+        chi2 = np.divide((observed - expected) ** 2, expected,
+                         out=np.zeros_like(observed), where=expected > 0).sum()
+        dof = len(self.segments) - 1
+        p_value = stats.chi2.sf(chi2, dof) if dof > 0 else 1.0
+
+        return {
+            'chi2': round(float(chi2), 4),
+            'dof': dof,
+            'p_value': float(p_value),
+            'significant': bool(p_value < self.alpha)
+        }
+
+    def generate_significance_report(self, name='Segment', correction='holm'):
+        """Generate significance testing report"""
+        chi_square = self.chi_square_test()
+        pairwise = self.pairwise_z_tests(correction)
+
+        print(f"\n🔬 {name} Significance Tests:")
+        print(f"   Chi-square: {chi_square['chi2']:.2f} (dof={chi_square['dof']}, "
+              f"p={chi_square['p_value']:.4g}) - "
+              f"{'significant' if chi_square['significant'] else 'not significant'}")
+        print(f"   Pairwise tests ({correction} corrected): "
+              f"{pairwise['significant'].sum()} of {len(pairwise)} pairs significant")
+
+        return pairwise
+
+if __name__ == "__main__":
+    # Example usage
+    from kpi_calculator import KPICalculator
+
+    df = pd.read_csv("data/processed_data.csv")
+    calculator = KPICalculator(df)
+
+    tester = SignificanceTester(calculator.calculate_channel_performance())
+    print(tester.generate_significance_report('Channel').to_string())
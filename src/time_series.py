@@ -0,0 +1,251 @@
+"""
+Time-Series Module for Marketing Campaign Analysis
+Builds a calendar date index and serves rolling, cohort and period-over-period trends
+"""
+
+import pandas as pd
+import numpy as np
+from data_preprocessing import MONTH_ORDER
+
+class TimeSeriesAnalyzer:
+    def __init__(self, df, base_year=2008):
+        self.df = df
+        self.base_year = base_year
+        self.dates = None
+        self.daily_conversions = None
+        self.daily_contacts = None
+        self._row_mask = None
+        self._day_offsets = None
+        self._period_starts = {}
+        self._segment_cache = {}
+
+    def _infer_years(self, month_num, day):
+        """
+        Infer the calendar year of each row
+        The Bank Marketing dataset is ordered by contact date with no year column,
+        so every time the month goes backwards a new year has started. The data
+        counts as date-ordered only if the day never goes backwards within a month
+        and each inferred year holds a run of rows rather than one or two (shuffled
+        rows go backwards between about every other pair); otherwise every row is
+        placed in base_year.
+        """
+        if 'year' in self.df.columns:
+            return self.df['year'].to_numpy()[self._row_mask].astype(int)
+
+        month_step = np.diff(month_num)
+        month_drops = month_step < 0
+        day_drops = (month_step == 0) & (np.diff(day) < 0)
+        if day_drops.any() or month_drops.sum() > len(month_num) // 4:
+            return np.full(len(month_num), self.base_year)
+        return self.base_year + np.concatenate([[0], np.cumsum(month_drops)])
+
+    def build_date_index(self):
+        """Build the date column and precompute daily conversion/contact arrays"""
+        print("\nBuilding date index...")
+
+        if 'day' not in self.df.columns or not {'month', 'month_num'} & set(self.df.columns):
+            print("Month/day columns not found")
+            return None
+
+        if 'month_num' in self.df.columns:
+            month_num = self.df['month_num']
+        else:
+            month_num = self.df['month'].map({m: i+1 for i, m in enumerate(MONTH_ORDER)})
+
+        self._row_mask = (month_num.notna() & self.df['day'].notna()).to_numpy()
+        month_num = month_num.to_numpy()[self._row_mask].astype(int)
+        day = self.df['day'].to_numpy()[self._row_mask].astype(int)
+        years = self._infer_years(month_num, day)
+
+        # Clip days past the end of the month (e.g. 31 feb in synthetic data)
+        month_start = pd.to_datetime(pd.DataFrame({'year': years, 'month': month_num, 'day': 1}))
+        days = np.minimum(day, month_start.dt.days_in_month.to_numpy())
+        dates = month_start + pd.to_timedelta(days - 1, unit='D')
+
+        self.df['date'] = pd.Series(dates.to_numpy(), index=self.df.index[self._row_mask])
+
+        origin = dates.min()
+        self._day_offsets = (dates - origin).dt.days.to_numpy()
+        n_days = int(self._day_offsets.max()) + 1
+
+        converted = self.df['converted'].to_numpy()[self._row_mask]
+        self.daily_contacts = np.bincount(self._day_offsets, minlength=n_days)
+        self.daily_conversions = np.bincount(self._day_offsets, weights=converted,
+                                             minlength=n_days).astype(int)
+        self.dates = pd.date_range(origin, periods=n_days, freq='D')
+        self._period_starts = {}
+        self._segment_cache = {}
+
+        print(f"Date index built: {self.dates[0].date()} to {self.dates[-1].date()} ({n_days} days)")
+        return self.df
+
+    def _ensure_index(self):
+        if self.dates is None:
+            self.build_date_index()
+
+    def _period_bounds(self, freq):
+        """Return period labels and the first day offset of each period"""
+        if freq not in self._period_starts:
+            labels = self.dates.to_period(freq)
+            starts = np.flatnonzero(np.concatenate([[True], labels[1:] != labels[:-1]]))
+            self._period_starts[freq] = (labels[starts], starts)
+        return self._period_starts[freq]
+
+    def _aggregate(self, daily, freq):
+        """Sum daily arrays (last axis) into periods"""
+        labels, starts = self._period_bounds(freq)
+        return labels, np.add.reduceat(daily, starts, axis=-1)
+
+    @staticmethod
+    def _rate(conversions, contacts):
+        rate = np.full(np.shape(contacts), np.nan)
+        np.divide(conversions * 100, contacts, out=rate, where=contacts > 0)
+        return rate.round(2)
+
+    def calculate_period_stats(self, freq='W'):
+        """Calculate conversions, contacts and conversion rate per period (D, W, M, Q, Y)"""
+        self._ensure_index()
+        labels, conversions = self._aggregate(self.daily_conversions, freq)
+        _, contacts = self._aggregate(self.daily_contacts, freq)
+
+        period_stats = pd.DataFrame({
+            'conversions': conversions,
+            'total_contacts': contacts,
+            'conversion_rate': self._rate(conversions, contacts)
+        }, index=labels)
+        period_stats.index.name = 'period'
+        return period_stats
+
+    def calculate_rolling_rate(self, window=7, freq='D'):
+        """Calculate rolling-window conversion rate over the last `window` periods"""
+        period_stats = self.calculate_period_stats(freq)
+
+        def rolling_sum(values):
+            csum = np.concatenate([[0], np.cumsum(values)])
+            rolled = np.full(len(values), np.nan)
+            rolled[window-1:] = csum[window:] - csum[:-window]
+            return rolled
+
+        rolling_conversions = rolling_sum(period_stats['conversions'].to_numpy())
+        rolling_contacts = rolling_sum(period_stats['total_contacts'].to_numpy())
+
+        rolling_stats = pd.DataFrame({
+            'rolling_conversions': rolling_conversions,
+            'rolling_contacts': rolling_contacts,
+            'conversion_rate': self._rate(np.nan_to_num(rolling_conversions),
+                                          np.nan_to_num(rolling_contacts))
+        }, index=period_stats.index)
+        return rolling_stats
+
+    def calculate_period_over_period(self, freq='W', periods=1):
+        """Calculate period-over-period change in contacts and conversion rate"""
+        period_stats = self.calculate_period_stats(freq)
+
+        contacts = period_stats['total_contacts'].to_numpy().astype(float)
+        previous_contacts = np.full(len(contacts), np.nan)
+        previous_contacts[periods:] = contacts[:-periods]
+
+        conversions = period_stats['conversions'].to_numpy().astype(float)
+        previous_conversions = np.full(len(conversions), np.nan)
+        previous_conversions[periods:] = conversions[:-periods]
+
+        # Two-proportion z-score of the change against the previous period
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pooled = (conversions + previous_conversions) / (contacts + previous_contacts)
+            std_err = np.sqrt(pooled * (1 - pooled) * (1 / contacts + 1 / previous_contacts))
+            diff = conversions / contacts - previous_conversions / previous_contacts
+            z_score = np.where(std_err > 0, diff / std_err, np.nan)
+
+        period_stats['rate_change'] = period_stats['conversion_rate'].diff(periods).round(2)
+        period_stats['z_score'] = z_score.round(2)
+        period_stats['contacts_change_pct'] = self._rate(contacts - previous_contacts,
+                                                         np.nan_to_num(previous_contacts))
+        period_stats['previous_contacts'] = previous_contacts
+        period_stats['complete'] = self._complete_periods(freq)
+        return period_stats
+
+    def _complete_periods(self, freq):
+        """Flag periods fully covered by the date range (first and last may be partial)"""
+        labels, _ = self._period_bounds(freq)
+        return np.asarray((labels.start_time >= self.dates[0]) &
+                          (labels.end_time.normalize() <= self.dates[-1]))
+
+    def calculate_cohort_table(self, segment_col, freq='M', value='conversion_rate'):
+        """
+        Build a segment x period table
+        value is one of 'conversion_rate', 'conversions' or 'total_contacts'
+        """
+        self._ensure_index()
+
+        if segment_col not in self._segment_cache:
+            codes, segments = pd.factorize(self.df[segment_col].to_numpy()[self._row_mask], sort=True)
+            valid = codes >= 0
+            n_days = len(self.dates)
+            flat = codes[valid] * n_days + self._day_offsets[valid]
+            size = len(segments) * n_days
+            converted = self.df['converted'].to_numpy()[self._row_mask][valid]
+            contacts = np.bincount(flat, minlength=size).reshape(len(segments), n_days)
+            conversions = np.bincount(flat, weights=converted,
+                                      minlength=size).astype(int).reshape(len(segments), n_days)
+            self._segment_cache[segment_col] = (segments, conversions, contacts)
+
+        segments, daily_conversions, daily_contacts = self._segment_cache[segment_col]
+        labels, conversions = self._aggregate(daily_conversions, freq)
+        _, contacts = self._aggregate(daily_contacts, freq)
+
+        tables = {
+            'conversions': conversions,
+            'total_contacts': contacts,
+            'conversion_rate': self._rate(conversions, contacts)
+        }
+        cohort = pd.DataFrame(tables[value], index=pd.Index(segments, name=segment_col),
+                              columns=labels)
+        return cohort
+
+    def detect_trend_alerts(self, freq='W', threshold=5.0, z_threshold=3.0, min_contacts=30):
+        """
+        Flag periods whose conversion rate moved by at least `threshold` points
+        and by at least `z_threshold` standard errors versus the previous period.
+        Partial periods at either end of the date range are never compared.
+        """
+        changes = self.calculate_period_over_period(freq)
+        complete = changes['complete'] & changes['complete'].shift(1, fill_value=False)
+        alerts = changes[complete &
+                         (changes['rate_change'].abs() >= threshold) &
+                         (changes['z_score'].abs() >= z_threshold) &
+                         (changes['total_contacts'] >= min_contacts) &
+                         (changes['previous_contacts'] >= min_contacts)]
+        return alerts[['total_contacts', 'conversion_rate', 'rate_change', 'z_score']]
+
+    def generate_trend_report(self, freq='W'):
+        """Generate time-series trend report"""
+        print("\n" + "="*50)
+        print("CAMPAIGN TREND REPORT")
+        print("="*50)
+
+        monthly = self.calculate_period_stats('M')
+        print(f"\n📅 Monthly Performance:")
+        print(monthly.to_string())
+
+        rolling = self.calculate_rolling_rate(window=4, freq=freq)
+        print(f"\n📈 Rolling 4-Period Conversion Rate (last 5):")
+        print(rolling.dropna().tail(5).to_string())
+
+        alerts = self.detect_trend_alerts(freq)
+        print(f"\n🚨 Trend Alerts ({len(alerts)}):")
+        if len(alerts):
+            print(alerts.tail(10).to_string())
+        else:
+            print("   No significant period-over-period changes")
+
+        print("\n" + "="*50)
+
+        return alerts
+
+if __name__ == "__main__":
+    # Example usage
+    df = pd.read_csv("data/processed_data.csv")
+
+    analyzer = TimeSeriesAnalyzer(df)
+    analyzer.build_date_index()
+    analyzer.generate_trend_report()
@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from pathlib import Path
+from data_preprocessing import MONTH_ORDER, load_column_store
 
 class CampaignVisualizer:
     def __init__(self, df, output_dir='outputs/figures'):
@@ -141,12 +142,9 @@ class CampaignVisualizer:
         
         fig, ax = plt.subplots(figsize=(12, 6))
         
-        month_order = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 
-                      'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-        
         monthly_stats = self.df.groupby('month')['converted'].agg(['sum', 'count'])
         monthly_stats['rate'] = (monthly_stats['sum'] / monthly_stats['count'] * 100).round(2)
-        monthly_stats = monthly_stats.reindex([m for m in month_order if m in monthly_stats.index])
+        monthly_stats = monthly_stats.reindex([m for m in MONTH_ORDER if m in monthly_stats.index])
         
         ax.plot(range(len(monthly_stats)), monthly_stats['rate'], 
                marker='o', linewidth=2.5, markersize=8, color='#2E86AB')
@@ -279,7 +277,10 @@ class CampaignVisualizer:
         if 'month' in self.df.columns:
             ax4 = fig.add_subplot(gs[1, 2])
             month_conv = self.df.groupby('month')['converted'].mean() * 100
+            month_conv = month_conv.reindex([m for m in MONTH_ORDER if m in month_conv.index])
             ax4.plot(month_conv.values, marker='o', color='green', linewidth=2)
+            ax4.set_xticks(range(len(month_conv)))
+            ax4.set_xticklabels([m[0].upper() for m in month_conv.index])
             ax4.set_title('Monthly Trends', fontweight='bold')
             ax4.set_ylabel('Rate (%)')
             ax4.grid(True, alpha=0.3)
@@ -321,6 +322,10 @@ class CampaignVisualizer:
         print("\nAll visualizations generated successfully!")
 
 if __name__ == "__main__":
-    df = pd.read_csv("data/processed_data.csv")
+    store_path = Path("data/processed_store")
+    if store_path.exists():
+        df = load_column_store(store_path)
+    else:
+        df = pd.read_csv("data/processed_data.csv")
     visualizer = CampaignVisualizer(df)
     visualizer.generate_all_visualizations()
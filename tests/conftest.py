@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the marketing campaign analysis tests
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from generate_sample_data import generate_sample_data
+from data_preprocessing import DataPreprocessor
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the progress output the analysis modules print"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def clean_sample_data(n_samples):
+    """Generate seeded sample data and run it through DataPreprocessor.clean_data"""
+    preprocessor = DataPreprocessor(None)
+    preprocessor.df = generate_sample_data(n_samples)
+    with quiet():
+        return preprocessor.clean_data()
+
+@pytest.fixture(scope='session')
+def _reference_df():
+    return clean_sample_data(5000)
+
+@pytest.fixture
+def reference_df(_reference_df):
+    """Cleaned 5,000-row seeded dataset used as the reference pandas path"""
+    return _reference_df.copy()
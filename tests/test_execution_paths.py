@@ -0,0 +1,200 @@
+"""
+Equivalence tests: every alternate execution path must match the reference pandas path
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from conftest import quiet
+import batch_analysis
+from batch_analysis import run_batch, run_campaign
+from data_preprocessing import DataPreprocessor, load_column_store
+from generate_sample_data import generate_sample_data
+from kpi_calculator import KPICalculator
+from significance import SignificanceTester, adjust_pvalues
+from time_series import TimeSeriesAnalyzer
+
+SEGMENT_COLUMNS = ['contact', 'age_group', 'education', 'job', 'month']
+
+def test_column_store_matches_dataframe(reference_df, tmp_path):
+    preprocessor = DataPreprocessor(None)
+    preprocessor.df = reference_df
+    with quiet():
+        preprocessor.save_column_store(tmp_path / 'store')
+    store_df = load_column_store(tmp_path / 'store')
+
+    decoded_df = load_column_store(tmp_path / 'store', decode_text=True)
+
+    assert list(store_df.columns) == list(reference_df.columns)
+    for col in reference_df.columns:
+        expected, actual = reference_df[col], store_df[col]
+        if isinstance(expected.dtype, pd.CategoricalDtype):
+            assert actual.dtype == expected.dtype, col
+            assert np.array_equal(actual.cat.codes, expected.cat.codes), col
+        elif pd.api.types.is_numeric_dtype(expected):
+            assert actual.dtype == expected.dtype, col
+            np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy(), err_msg=col)
+        else:
+            # Text columns are stored as categoricals with string categories
+            assert isinstance(actual.dtype, pd.CategoricalDtype), col
+            assert pd.api.types.is_string_dtype(actual.cat.categories), col
+            assert actual.isna().equals(expected.isna()), col
+            assert actual.dropna().astype(str).tolist() == expected.dropna().tolist(), col
+            assert decoded_df[col].isna().equals(expected.isna()), col
+            assert decoded_df[col].dropna().tolist() == expected.dropna().tolist(), col
+
+    with quiet():
+        assert KPICalculator(store_df).generate_kpi_report() == \
+               KPICalculator(reference_df).generate_kpi_report()
+    for col in SEGMENT_COLUMNS:
+        expected = KPICalculator(reference_df).calculate_channel_performance(col)
+        actual = KPICalculator(store_df).calculate_channel_performance(col)
+        assert list(actual.index.astype(str)) == list(expected.index.astype(str))
+        assert np.array_equal(actual.to_numpy(), expected.to_numpy())
+
+def test_column_store_is_memory_mapped(reference_df, tmp_path):
+    preprocessor = DataPreprocessor(None)
+    preprocessor.df = reference_df
+    with quiet():
+        preprocessor.save_column_store(tmp_path / 'store')
+    store_df = load_column_store(tmp_path / 'store', columns=['age', 'job'])
+
+    def is_mapped(values):
+        while values is not None and not isinstance(values, np.memmap):
+            values = getattr(values, 'base', None)
+        return values is not None
+
+    assert list(store_df.columns) == ['age', 'job']
+    assert is_mapped(store_df['age'].to_numpy())
+    assert is_mapped(store_df['job'].array.codes)
+
+def test_batch_runner_matches_sequential(tmp_path):
+    data_dir = tmp_path / 'campaigns'
+    data_dir.mkdir()
+    for n_samples in (2000, 3000):
+        generate_sample_data(n_samples).to_csv(data_dir / f'region_{n_samples}.csv', index=False)
+
+    with quiet():
+        combined = run_batch(data_dir, tmp_path / 'out', max_workers=2, make_figures=False)
+
+    assert (combined['status'] == 'ok').all()
+    for campaign, row in combined.iterrows():
+        preprocessor = DataPreprocessor(data_dir / f'{campaign}.csv')
+        with quiet():
+            preprocessor.load_data()
+            kpis = KPICalculator(preprocessor.clean_data()).generate_kpi_report()
+        for name, value in kpis.items():
+            assert row[name] == value
+        assert (tmp_path / 'out' / campaign / 'kpis.csv').exists()
+
+def test_time_series_matches_pandas(reference_df):
+    analyzer = TimeSeriesAnalyzer(reference_df)
+    with quiet():
+        df = analyzer.build_date_index()
+
+    daily = df.groupby('date')['converted'].agg(['sum', 'count']).reindex(analyzer.dates, fill_value=0)
+    assert np.array_equal(analyzer.daily_conversions, daily['sum'])
+    assert np.array_equal(analyzer.daily_contacts, daily['count'])
+
+    weekly = analyzer.calculate_period_stats('W')
+    expected = df.groupby(df['date'].dt.to_period('W'))['converted'].agg(['sum', 'count'])
+    assert np.array_equal(weekly['conversions'], expected['sum'])
+    assert np.array_equal(weekly['total_contacts'], expected['count'])
+
+    rolling = analyzer.calculate_rolling_rate(window=7)
+    expected = daily.rolling(7).sum()
+    np.testing.assert_array_equal(rolling['rolling_contacts'], expected['count'])
+    np.testing.assert_array_equal(rolling['rolling_conversions'], expected['sum'])
+
+    cohort = analyzer.calculate_cohort_table('contact', 'M')
+    expected = df.groupby(['contact', df['date'].dt.to_period('M')])['converted'].mean()
+    expected = (expected * 100).round(2).unstack()
+    np.testing.assert_allclose(cohort.to_numpy(), expected.to_numpy())
+
+def test_significance_matches_scalar_reference(reference_df):
+    job_stats = KPICalculator(reference_df).calculate_conversion_rate('job')
+    tester = SignificanceTester(job_stats)
+
+    observed = np.vstack([tester.conversions, tester.contacts - tester.conversions])
+    chi2, p_value, dof, _ = stats.chi2_contingency(observed, correction=False)
+    result = tester.chi_square_test()
+    assert result['dof'] == dof
+    assert np.isclose(result['chi2'], chi2, atol=1e-4)
+    assert np.isclose(result['p_value'], p_value)
+
+    pairwise = tester.pairwise_z_tests(correction='bonferroni')
+    for row in pairwise.itertuples():
+        x1, n1 = job_stats.loc[row.segment_a, ['sum', 'count']]
+        x2, n2 = job_stats.loc[row.segment_b, ['sum', 'count']]
+        pooled = (x1 + x2) / (n1 + n2)
+        z = (x2 / n2 - x1 / n1) / np.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+        assert np.isclose(row.z_score, z, atol=1e-4)
+        assert np.isclose(row.p_value, 2 * stats.norm.sf(abs(z)))
+        assert np.isclose(row.p_adjusted, min(row.p_value * len(pairwise), 1.0))
+
+def test_adjust_pvalues():
+    p_values = [0.01, 0.04, 0.03, 0.005]
+    np.testing.assert_allclose(adjust_pvalues(p_values, 'holm'), [0.03, 0.06, 0.06, 0.02])
+    np.testing.assert_allclose(adjust_pvalues(p_values, 'fdr_bh'), [0.02, 0.04, 0.04, 0.02])
+
+def _crashing_campaign(campaign, data_path, output_dir, make_figures=True):
+    if campaign == 'crash':
+        os._exit(1)
+    return run_campaign(campaign, data_path, output_dir, make_figures)
+
+def test_batch_runner_survives_dead_worker(tmp_path, monkeypatch):
+    data_dir = tmp_path / 'campaigns'
+    data_dir.mkdir()
+    names = ['a_region', 'crash', 'region', 'z1', 'z2', 'z3']
+    for name in names:
+        generate_sample_data(1000).to_csv(data_dir / f'{name}.csv', index=False)
+    monkeypatch.setattr(batch_analysis, 'run_campaign', _crashing_campaign)
+
+    with quiet():
+        combined = run_batch(data_dir, tmp_path / 'out', max_workers=2, make_figures=False)
+
+    assert sorted(combined.index) == names
+    assert combined.loc['crash', 'status'] == 'failed'
+    assert 'BrokenProcessPool' in combined.loc['crash', 'error']
+    assert combined.loc['region', 'status'] == 'ok'
+    assert (combined.drop(index='crash')['status'] == 'ok').all()
+    saved = pd.read_csv(tmp_path / 'out' / 'campaign_kpis.csv', index_col='campaign')
+    assert sorted(saved.index) == names
+
+def save_store(df, store_dir):
+    preprocessor = DataPreprocessor(None)
+    preprocessor.df = df
+    with quiet():
+        preprocessor.save_column_store(store_dir)
+
+def test_column_store_rewrite_while_open(tmp_path):
+    store_dir = tmp_path / 'store'
+    save_store(pd.DataFrame({'n': [1, 2, 3, 4], 'text': ['a', 'b', 'c', 'd']}), store_dir)
+    reader_df = load_column_store(store_dir)
+
+    save_store(pd.DataFrame({'n': [9, 9, 9, 9], 'text': ['z', 'z', 'z', 'z']}), store_dir)
+    save_store(pd.DataFrame({'n': [7, 7, 7, 7], 'text': ['y', 'y', 'y', 'y']}), store_dir)
+
+    # The already-open frame keeps its own data and dictionary
+    assert reader_df['n'].tolist() == [1, 2, 3, 4]
+    assert reader_df['text'].astype(str).tolist() == ['a', 'b', 'c', 'd']
+    # New readers see the latest save; only the last two versions are kept
+    assert load_column_store(store_dir)['n'].tolist() == [7, 7, 7, 7]
+    assert len([p for p in store_dir.iterdir() if p.is_dir()]) == 2
+
+def test_column_store_odd_column_names(tmp_path):
+    df = pd.DataFrame({'rate/day': [0.5, 0.25], 'a b': ['x', 'y'], '..': [1, 2]})
+    save_store(df, tmp_path / 'store')
+    store_df = load_column_store(tmp_path / 'store')
+    assert list(store_df.columns) == list(df.columns)
+    assert store_df['rate/day'].tolist() == [0.5, 0.25]
+
+def test_column_store_numeric_categories(tmp_path):
+    df = pd.DataFrame({'bucket': pd.Categorical([3, 1, 2, 1], categories=[1, 2, 3], ordered=True)})
+    save_store(df, tmp_path / 'store')
+    bucket = load_column_store(tmp_path / 'store')['bucket']
+    assert bucket.dtype == df['bucket'].dtype
+    assert bucket.tolist() == [3, 1, 2, 1]
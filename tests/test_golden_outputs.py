@@ -0,0 +1,78 @@
+"""
+Golden-output tests pinning KPI values on the seeded sample dataset
+Any change to these numbers must be deliberate: update the pinned values in the same commit
+"""
+
+import pytest
+
+from conftest import quiet
+from kpi_calculator import KPICalculator
+
+GOLDEN_KPIS = {
+    'CAC': 125.82,
+    'Total_Marketing_Spend': 250000,
+    'Customers_Acquired': 1987,
+    'ROI': 694.8,
+    'Revenue': 1987000,
+    'CLV': 2142.86,
+}
+
+GOLDEN_AGE_CONVERSION = {
+    '<25': 64.73, '25-35': 64.74, '35-45': 29.28,
+    '45-55': 28.16, '55-65': 29.47, '65+': 32.3,
+}
+
+# clean_data maps 'unknown' to missing, so it never appears as a channel
+GOLDEN_CHANNELS = {
+    'cellular': (1446, 3226, 44.82),
+    'telephone': (371, 1269, 29.24),
+}
+
+GOLDEN_MISSING = {'education': 1277, 'contact': 505, 'poutcome': 1237}
+
+GOLDEN_CAMPAIGNS = {
+    1: (51, 95, 53.68),
+    2: (56, 93, 60.22),
+    3: (69, 130, 53.08),
+    4: (35, 87, 40.23),
+    5: (48, 106, 45.28),
+}
+
+def test_kpi_report(reference_df):
+    calculator = KPICalculator(reference_df)
+    with quiet():
+        kpis = calculator.generate_kpi_report()
+    assert kpis == GOLDEN_KPIS
+
+def test_overall_conversion_rate(reference_df):
+    assert KPICalculator(reference_df).calculate_conversion_rate() == 39.74
+
+def test_conversion_by_age_group(reference_df):
+    age_conversion = KPICalculator(reference_df).calculate_conversion_rate('age_group')
+    assert age_conversion['conversion_rate'].to_dict() == GOLDEN_AGE_CONVERSION
+
+def test_unknown_mapped_to_missing(reference_df):
+    text_columns = reference_df.select_dtypes(exclude=['number', 'category']).columns
+    assert not (reference_df[text_columns] == 'unknown').any().any()
+    missing = reference_df.isna().sum()
+    assert missing[missing > 0].to_dict() == GOLDEN_MISSING
+
+def test_channel_performance(reference_df):
+    channel_stats = KPICalculator(reference_df).calculate_channel_performance()
+    assert list(channel_stats.index) == list(GOLDEN_CHANNELS)
+    for channel, expected in GOLDEN_CHANNELS.items():
+        assert tuple(channel_stats.loc[channel]) == expected
+
+def test_campaign_effectiveness(reference_df):
+    campaign_stats = KPICalculator(reference_df).calculate_campaign_effectiveness()
+    for campaign, expected in GOLDEN_CAMPAIGNS.items():
+        assert tuple(campaign_stats.loc[campaign]) == expected
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({'avg_customer_value': 1000, 'retention_rate': 0.75, 'discount_rate': 0.10}, 2142.86),
+    ({'avg_customer_value': 500, 'retention_rate': 0.5, 'discount_rate': 0.05}, 454.55),
+])
+def test_clv_formula(reference_df, kwargs, expected):
+    calculator = KPICalculator(reference_df)
+    calculator.calculate_clv(**kwargs)
+    assert calculator.kpis['CLV'] == expected
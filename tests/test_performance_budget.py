@@ -0,0 +1,119 @@
+"""
+Performance budget tests: each pipeline stage must stay within its time and
+peak-memory budget on a fixed 50,000-row dataset. Time budgets are multiples
+of a reference pandas groupby workload timed on the same machine, so they hold
+on slow and fast hardware alike. Both kinds of budget sit at roughly 2-3x the
+measured baseline, so a stage that gets several times slower or bigger fails.
+If a change deliberately alters a stage's cost, re-measure and update the
+budget in the same commit.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from conftest import clean_sample_data, quiet
+from data_preprocessing import DataPreprocessor, load_column_store
+from generate_sample_data import generate_sample_data
+from kpi_calculator import KPICalculator
+from significance import SignificanceTester
+from time_series import TimeSeriesAnalyzer
+from visualization import CampaignVisualizer
+
+BUDGET_ROWS = 50000
+REPEATS = 5
+
+# stage: (time in reference-workload units, peak MB)
+# Baselines: clean_data ~3x / 13.2MB, kpi_report ~0.7x / 1.4MB, time_series ~1x / 4.3MB,
+# significance ~0.04x / 0.02MB, column_store_save ~2x / 1.8MB, column_store_open ~0.25x / 0.08MB,
+# visualization ~110-170x / 3.9MB
+STAGE_BUDGETS = {
+    'clean_data': (9.0, 33),
+    'kpi_report': (2.0, 4),
+    'time_series': (3.0, 11),
+    'significance': (0.12, 0.1),
+    'column_store_save': (5.0, 5),
+    'column_store_open': (0.75, 0.25),
+    'visualization': (400.0, 10),
+}
+
+@pytest.fixture(scope='module')
+def budget_df():
+    return clean_sample_data(BUDGET_ROWS)
+
+@pytest.fixture(scope='module')
+def reference_seconds(budget_df):
+    """Best-of-REPEATS time of a plain pandas segment aggregation on this machine"""
+    def workload():
+        for col in ['job', 'education', 'contact', 'month', 'campaign', 'age_group']:
+            budget_df.groupby(col, observed=True)['converted'].agg(['sum', 'count', 'mean'])
+    return best_time(lambda: workload, REPEATS)
+
+def best_time(make_func, repeats):
+    """Best wall time of make_func()() over repeats; setup in make_func is not timed"""
+    times = []
+    for _ in range(repeats):
+        func = make_func()
+        start = time.perf_counter()
+        with quiet():
+            func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def peak_memory_mb(make_func):
+    func = make_func()
+    tracemalloc.start()
+    try:
+        with quiet():
+            func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+def measure(stage, make_func, reference_seconds, repeats=REPEATS):
+    """
+    Assert a stage stays within its time and memory budget
+    make_func builds a fresh callable for each run; time and memory are measured
+    in separate runs because tracemalloc slows the code it traces
+    """
+    max_units, max_mb = STAGE_BUDGETS[stage]
+    units = best_time(make_func, repeats) / reference_seconds
+    peak_mb = peak_memory_mb(make_func)
+
+    assert units <= max_units, f"{stage} took {units:.2f}x the reference workload (budget {max_units}x)"
+    assert peak_mb <= max_mb, f"{stage} peaked at {peak_mb:.2f}MB (budget {max_mb}MB)"
+
+def test_clean_data_budget(reference_seconds):
+    raw = generate_sample_data(BUDGET_ROWS)
+
+    def make():
+        preprocessor = DataPreprocessor(None)
+        preprocessor.df = raw.copy()
+        return preprocessor.clean_data
+    measure('clean_data', make, reference_seconds)
+
+def test_kpi_report_budget(budget_df, reference_seconds):
+    measure('kpi_report', lambda: KPICalculator(budget_df.copy()).generate_kpi_report, reference_seconds)
+
+def test_time_series_budget(budget_df, reference_seconds):
+    measure('time_series', lambda: TimeSeriesAnalyzer(budget_df.copy()).generate_trend_report,
+            reference_seconds)
+
+def test_significance_budget(budget_df, reference_seconds):
+    job_stats = KPICalculator(budget_df).calculate_conversion_rate('job')
+    measure('significance', lambda: SignificanceTester(job_stats).generate_significance_report,
+            reference_seconds)
+
+def test_column_store_budget(budget_df, tmp_path, reference_seconds):
+    preprocessor = DataPreprocessor(None)
+    preprocessor.df = budget_df.copy()
+    measure('column_store_save', lambda: lambda: preprocessor.save_column_store(tmp_path / 'store'),
+            reference_seconds)
+    measure('column_store_open', lambda: lambda: load_column_store(tmp_path / 'store'),
+            reference_seconds)
+
+def test_visualization_budget(budget_df, tmp_path, reference_seconds):
+    def make():
+        return CampaignVisualizer(budget_df.copy(), output_dir=tmp_path / 'figures').generate_all_visualizations
+    measure('visualization', make, reference_seconds, repeats=1)
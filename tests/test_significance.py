@@ -0,0 +1,44 @@
+"""
+Tests for the sequential significance test
+"""
+
+import numpy as np
+import pandas as pd
+
+from significance import sequential_test
+
+def test_sequential_test_zero_conversion_first_look():
+    conversions = [[0, 5, 6, 7], [0, 10, 12, 15]]
+    contacts = [[50, 50, 50, 50], [50, 50, 50, 50]]
+    result = sequential_test(conversions, contacts)
+
+    assert not result['p_value'].isna().any()
+    assert result['p_value'].iloc[0] == 1.0
+    assert result['p_value'].is_monotonic_decreasing
+
+def test_sequential_test_empty_arm():
+    result = sequential_test([[0, 10, 20], [5, 10, 20]], [[0, 100, 100], [50, 100, 100]])
+    assert not result['p_value'].isna().any()
+    assert result['p_value'].iloc[0] == 1.0
+
+def test_sequential_test_detects_real_difference():
+    rng = np.random.default_rng(1)
+    contacts = np.full((2, 30), 200)
+    conversions = np.vstack([rng.binomial(200, 0.10, 30), rng.binomial(200, 0.16, 30)])
+    periods = pd.period_range('2008-01', periods=30, freq='W')
+    result = sequential_test(pd.DataFrame(conversions, columns=periods),
+                             pd.DataFrame(contacts, columns=periods))
+
+    assert list(result.index) == list(periods)
+    assert result['significant'].iloc[-1]
+    assert result['rate_b'].iloc[-1] > result['rate_a'].iloc[-1]
+
+def test_sequential_test_false_positive_rate():
+    # Checking after every look must not inflate the false positive rate beyond alpha
+    rng = np.random.default_rng(0)
+    contacts = np.full((2, 30), 200)
+    false_positives = sum(
+        sequential_test(rng.binomial(200, 0.1, size=(2, 30)), contacts)['significant'].any()
+        for _ in range(300)
+    )
+    assert false_positives / 300 <= 0.05
@@ -0,0 +1,87 @@
+"""
+Tests for the time-series trend engine
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import clean_sample_data, quiet
+from time_series import TimeSeriesAnalyzer
+
+def build(df):
+    analyzer = TimeSeriesAnalyzer(df)
+    with quiet():
+        analyzer.build_date_index()
+    return analyzer
+
+def test_no_alerts_on_stationary_data(reference_df):
+    # Every week of the seeded sample has the same underlying conversion rate
+    assert build(reference_df).detect_trend_alerts().empty
+
+def test_partial_periods_are_flagged(reference_df):
+    changes = build(reference_df).calculate_period_over_period('W')
+    # 2008-01-01 is a Tuesday and 2008-12-31 a Wednesday, so both end weeks are partial
+    assert not changes['complete'].iloc[0]
+    assert not changes['complete'].iloc[-1]
+    assert changes['complete'].iloc[1:-1].all()
+
+def test_alert_on_real_drop():
+    df = clean_sample_data(10000)
+    build(df)
+    drop_week = (df['date'] >= '2008-06-09') & (df['date'] <= '2008-06-15')
+    df.loc[drop_week & (np.arange(len(df)) % 2 == 0), 'converted'] = 0
+
+    alerts = build(df.drop(columns='date')).detect_trend_alerts()
+    assert str(alerts.index[0]) == '2008-06-09/2008-06-15'
+    assert alerts['rate_change'].iloc[0] < 0
+    assert abs(alerts['z_score'].iloc[0]) >= 3.0
+
+def test_missing_day_column(reference_df):
+    analyzer = TimeSeriesAnalyzer(reference_df.drop(columns='day'))
+    with quiet():
+        assert analyzer.build_date_index() is None
+
+def test_period_over_period_matches_pandas(reference_df):
+    analyzer = build(reference_df)
+    changes = analyzer.calculate_period_over_period('M')
+    monthly = reference_df.groupby(reference_df['date'].dt.to_period('M'))['converted'].agg(['sum', 'count'])
+    rate = monthly['sum'] / monthly['count']
+
+    np.testing.assert_allclose(changes['rate_change'].iloc[1:],
+                               (rate * 100).round(2).diff().round(2).iloc[1:])
+    pooled = (monthly['sum'] + monthly['sum'].shift()) / (monthly['count'] + monthly['count'].shift())
+    z_score = rate.diff() / np.sqrt(pooled * (1 - pooled) * (1 / monthly['count'] + 1 / monthly['count'].shift()))
+    np.testing.assert_allclose(changes['z_score'].iloc[1:], z_score.round(2).iloc[1:])
+    np.testing.assert_allclose(changes['contacts_change_pct'].iloc[1:],
+                               (monthly['count'].pct_change() * 100).round(2).iloc[1:])
+    assert changes['complete'].all()
+
+def test_year_rollover_inference(reference_df):
+    # Date-ordered data spanning two years, like the original Bank Marketing file
+    ordered = reference_df.sort_values(['month_num', 'day'])
+    two_years = pd.concat([ordered.iloc[::2], ordered.iloc[1::2]], ignore_index=True)
+    analyzer = build(two_years)
+
+    yearly = analyzer.calculate_period_stats('Y')
+    assert [str(p) for p in yearly.index] == ['2008', '2009']
+    assert yearly['total_contacts'].tolist() == [len(ordered.iloc[::2]), len(ordered.iloc[1::2])]
+    assert two_years['date'].iloc[0].year == 2008
+    assert two_years['date'].iloc[-1].year == 2009
+
+@pytest.mark.parametrize('n_samples', [25, 5000])
+def test_shuffled_months_use_base_year(n_samples):
+    analyzer = TimeSeriesAnalyzer(clean_sample_data(n_samples), base_year=2010)
+    with quiet():
+        df = analyzer.build_date_index()
+    assert (df['date'].dt.year == 2010).all()
+    assert len(analyzer.dates) <= 366
+
+def test_daily_alerts_do_not_warn():
+    analyzer = build(clean_sample_data(300))
+    assert (analyzer.calculate_period_stats('D')['total_contacts'] == 0).any()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        analyzer.detect_trend_alerts('D')